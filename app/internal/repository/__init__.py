@@ -53,7 +53,8 @@ Examples:
         ...
         ...    async def change_password(self, cmd: ChangeUserPasswordCommand):
         ...        user = await self.repository.listen_queue(,
-        ...        user.password = cmd.new_password
+        ...        # Read models are frozen, change them through a copy.
+        ...        user = user.model_copy(update={"password": cmd.new_password})
         ...        user.migrate(ChangeUserPasswordCommand)
         ...        return self.repository.update(cmd=cmd.migrate(UpdateUserCommand))
 """
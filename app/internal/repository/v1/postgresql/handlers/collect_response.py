@@ -1,10 +1,13 @@
 """Collect response module."""
 
-from functools import wraps
+from collections.abc import AsyncIterator, Mapping
+from functools import lru_cache, partial, wraps
+from types import GenericAlias, UnionType
 from typing import (
     Any,
     Callable,
     List,
+    Optional,
     Type,
     Union,
     get_args,
@@ -13,56 +16,286 @@ from typing import (
 )
 
 from pydantic import TypeAdapter
+from sqlalchemy.exc import SQLAlchemyError
 
 from app.internal.repository.v1.postgresql.handlers.handle_exception import (
-    handle_exception,
+    raise_repository_error,
 )
-from app.pkg.models.base import Model
+from app.pkg.models.base import BaseModel, Model
 from app.pkg.models.v1.exceptions.repository import EmptyResult
 
+# Return annotations are static, so one adapter per type is enough.
+_get_adapter = lru_cache(maxsize=None)(TypeAdapter)
+
+_MISSING = object()
+
+
+def collect_response(
+    fn: Optional[Callable] = None,
+    *,
+    trusted: bool = False,
+) -> Callable:
+    """Convert response of ``fn`` to the model annotated in its return type.
+
+    Args:
+        fn:
+            Target function that contains a query in postgresql.
+        trusted:
+            If True, rows are assumed to already match the model schema and
+            models are built with ``model_construct`` skipping validation.
+            Use only for rows read straight from the database.
+
+    Examples:
+        Both forms are supported::
+
+            >>> @collect_response
+            ... async def read(self) -> models.User: ...
+            >>> @collect_response(trusted=True)
+            ... async def read_all(self) -> list[models.User]: ...
+
+    Returns:
+        Wrapped function.
+    """
+
+    if fn is None:
+        return partial(collect_response, trusted=trusted)
+
+    finalize = _build_finalizer(fn, trusted=trusted)
 
-def collect_response(fn) -> Callable:
     @wraps(fn)
-    @handle_exception
     async def inner(
         *args: Any,
         **kwargs: Any,
     ) -> Union[List[Type[Model]], Type[Model], None]:
-        response = await fn(*args, **kwargs)
-        return await process_response(fn, response)
+        # Same as ``handle_exception``, inlined to save a coroutine per call.
+        # Converting rows may hit lazy loads on detached ORM objects, so it
+        # stays inside the ``try`` as well.
+        try:
+            response = await fn(*args, **kwargs)
+            return finalize(response)
+        except SQLAlchemyError as error:
+            raise_repository_error(error)
+
+    return inner
+
+
+def collect_response_iter(
+    fn: Optional[Callable] = None,
+    *,
+    trusted: bool = False,
+) -> Callable:
+    """Lazy form of :func:`.collect_response`.
+
+    The wrapped function becomes an async generator converting rows one by
+    one, so the converted list is never materialized next to the raw rows.
+    ``fn`` may return a sequence of rows or an async iterable (e.g. result
+    of ``AsyncSession.stream``) that stays valid after ``fn`` returns.
+
+    Args:
+        fn:
+            Target function that contains a query in postgresql. Its return
+            annotation must be a generic over the model, like ``list[Model]``
+            or ``AsyncIterator[Model]``.
+        trusted:
+            Same as in :func:`.collect_response`.
+
+    Examples:
+        Rows can be streamed straight to a ``StreamingResponse``::
+
+            >>> @collect_response_iter(trusted=True)
+            ... async def read_all(self) -> list[models.User]: ...
+            >>> async for user in repository.read_all():
+            ...     ...
+
+    Returns:
+        Wrapped function. Nothing is yielded for an empty response.
+    """
+
+    if fn is None:
+        return partial(collect_response_iter, trusted=trusted)
+
+    convert = _build_item_converter(fn, trusted=trusted)
+
+    @wraps(fn)
+    async def inner(*args: Any, **kwargs: Any) -> AsyncIterator[Model]:
+        try:
+            response = await fn(*args, **kwargs)
+            if hasattr(response, "__aiter__"):
+                async for row in response:
+                    yield convert(row)
+            else:
+                for row in response or ():
+                    yield convert(row)
+        except SQLAlchemyError as error:
+            raise_repository_error(error)
 
     return inner
 
 
-async def process_response(
-    fn: Callable,
-    response: Any,
-) -> Union[List[Type[Model]], Type[Model], None]:
+def _build_item_converter(fn: Callable, trusted: bool = False) -> Callable[[Any], Any]:
+    """Build a single row converter from the item type of ``fn`` return
+    annotation.
+
+    Args:
+        fn: The target function.
+        trusted: Build models with ``model_construct`` instead of validating.
+
+    Raises:
+        TypeError: If the return annotation is not a generic over a model.
+
+    Returns:
+        Callable converting one row to the annotated model.
+    """
+
+    return_annotation = get_type_hints(fn).get("return")
+    if _is_optional(return_annotation):
+        return_annotation = _unwrap_optional(return_annotation)
+
+    item_types = get_args(return_annotation)
+    if not (
+        len(item_types) == 1
+        and isinstance(item_types[0], type)
+        and issubclass(item_types[0], BaseModel)
+    ):
+        raise TypeError(
+            f"{fn.__qualname__} must be annotated with a generic over a model, "
+            f"like list[Model], got {return_annotation!r}",
+        )
+    item_type = item_types[0]
+
+    if trusted:
+        constructor = _get_constructor(item_type)
+        if constructor is not None:
+            return constructor
+    return _get_adapter(item_type).validate_python
+
+
+def _build_finalizer(fn: Callable, trusted: bool = False) -> Callable[[Any], Any]:
+    """Pick the response converter for ``fn`` based on its return annotation.
+
+    The annotation is resolved once, at decoration time, so the wrapped
+    function only runs the converter on each call.
+
+    Args:
+        fn: The target function.
+        trusted: Build models with ``model_construct`` instead of validating.
+
+    Returns:
+        Callable converting a raw response to the annotated type.
+    """
+
     return_annotation = get_type_hints(fn).get("return")
     if return_annotation is None or return_annotation is type(None):
-        return None
+        return _return_none
 
     origin = get_origin(return_annotation)
-    is_optional = origin is Union and type(None) in get_args(return_annotation)
+    is_optional = _is_optional(return_annotation)
+    base_type = return_annotation
+    if is_optional:
+        base_type = _unwrap_optional(return_annotation)
+
+    # ``List[X]`` and ``list[X]`` share one adapter; rows are validated in a
+    # single pydantic-core call instead of one call per row.
+    if get_origin(base_type) is list:
+        base_type = GenericAlias(list, (get_args(base_type)[0],))
+
+    convert: Optional[Callable[[Any], Any]] = None
+    if trusted:
+        convert = _get_constructor(base_type)
+    if convert is None:
+        convert = _get_adapter(base_type).validate_python
+
+    if origin is list:
+        return _return_list(convert)
+    if is_optional:
+        return _return_optional(convert)
+    return _return_single(convert)
+
+
+def _is_optional(annotation: Any) -> bool:
+    if get_origin(annotation) not in (Union, UnionType):
+        return False
+    return type(None) in get_args(annotation)
+
+
+def _unwrap_optional(annotation: Any) -> Any:
+    """Get ``X`` from ``Optional[X]`` / ``X | None``.
+
+    Args:
+        annotation: Optional type annotation.
+
+    Returns:
+        First type argument that is not ``None``.
+    """
 
-    if is_optional and not response:
+    args = get_args(annotation)
+    if len(args) == 2:
+        return args[0] if args[1] is type(None) else args[1]
+    return next(t for t in args if t is not type(None))
+
+
+def _get_constructor(base_type: Any) -> Optional[Callable[[Any], Any]]:
+    """Get a validation-skipping converter for ``base_type``.
+
+    Args:
+        base_type: Model type or ``list`` of model type.
+
+    Returns:
+        Converter built on ``model_construct`` or None if ``base_type`` is not
+        a :class:`.BaseModel` (or a list of them).
+    """
+
+    is_list = get_origin(base_type) is list
+    model = get_args(base_type)[0] if is_list else base_type
+    if not (isinstance(model, type) and issubclass(model, BaseModel)):
         return None
 
-    if origin is list and not response:
-        return []
+    construct = partial(_construct, model)
+    if is_list:
+        return lambda rows: [construct(row) for row in rows]
+    return construct
 
-    if not response:
-        raise EmptyResult
 
-    base_type = None
-    if is_optional:
-        base_type = [t for t in get_args(return_annotation) if t is not type(None)][0]
-    else:
-        base_type = return_annotation
+def _construct(model: Type[BaseModel], row: Any) -> BaseModel:
+    if isinstance(row, Mapping):
+        return model.model_construct(**row)
 
-    adapter = TypeAdapter(base_type)
+    # Attributes missing on the row are left to ``model_construct`` defaults,
+    # the same as missing keys of a mapping row.
+    values: dict[str, Any] = {}
+    for name in model.model_fields:
+        value = getattr(row, name, _MISSING)
+        if value is not _MISSING:
+            values[name] = value
+    return model.model_construct(**values)
 
-    if origin is list:
-        return [adapter.validate_python(obj) for obj in response]
 
-    return adapter.validate_python(response)
+def _return_none(response: Any) -> None:
+    return None
+
+
+def _return_single(convert: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    def finalize(response: Any) -> Any:
+        if not response:
+            raise EmptyResult
+        return convert(response)
+
+    return finalize
+
+
+def _return_optional(convert: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    def finalize(response: Any) -> Any:
+        if not response:
+            return None
+        return convert(response)
+
+    return finalize
+
+
+def _return_list(convert: Callable[[Any], list]) -> Callable[[Any], list]:
+    def finalize(response: Any) -> list:
+        if not response:
+            return []
+        return convert(response)
+
+    return finalize
@@ -1,6 +1,6 @@
 """Handle Postgresql Query Exceptions."""
 
-from typing import Any, Callable, Coroutine
+from typing import Any, Callable, Coroutine, NoReturn
 
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
@@ -19,16 +19,29 @@ def handle_exception(
     async def wrapper(*args: object, **kwargs: object) -> Model:
         try:
             return await func(*args, **kwargs)
-        except IntegrityError as error:
-            if "unique constraint" in str(error).lower():
-                logger.exception(f"Unique constraint violation: {error}")
-                raise UniqueViolation from error
-
-            logger.exception(f"Integrity error: {error}")
-            raise DriverError(error_details=str(error)) from error
-
         except SQLAlchemyError as error:
-            logger.exception(f"SQLAlchemy error: {error}")
-            raise DriverError(error_details=str(error)) from error
+            raise_repository_error(error)
 
     return wrapper
+
+
+def raise_repository_error(error: SQLAlchemyError) -> NoReturn:
+    """Log SQLAlchemy exception and reraise it as a repository exception.
+
+    Must be called from an ``except`` block.
+
+    Raises:
+        UniqueViolation: on unique constraint violation.
+        DriverError: on any other SQLAlchemy error.
+    """
+
+    if isinstance(error, IntegrityError):
+        if "unique constraint" in str(error).lower():
+            logger.exception(f"Unique constraint violation: {error}")
+            raise UniqueViolation from error
+
+        logger.exception(f"Integrity error: {error}")
+        raise DriverError(error_details=str(error)) from error
+
+    logger.exception(f"SQLAlchemy error: {error}")
+    raise DriverError(error_details=str(error)) from error
@@ -1,7 +1,7 @@
 """Collect response from aiopg and convert it to an annotated model."""
 
 import json
-from functools import wraps
+from functools import lru_cache, wraps
 from types import NoneType
 from typing import Any, Callable, List, Optional, Type, Union, get_args, get_origin
 
@@ -13,6 +13,10 @@ from app.pkg.models.v1.exceptions.repository import EmptyResult
 
 __all__ = ["collect_response"]
 
+# ``result_model`` is one of a handful of static types, so one adapter per
+# type is enough.
+_get_adapter = lru_cache(maxsize=None)(TypeAdapter)
+
 
 def collect_response(fn) -> Callable[..., Model]:
     """Convert response from aioredis to an annotated model.
@@ -81,12 +85,11 @@ async def process_response(
     if return_annotation is None or return_annotation is NoneType:
         return None
 
-    origin = get_origin(return_annotation)
-    is_optional = __is_optional_type(origin)
+    origin, is_optional, model_type, annotations = __get_result_spec(
+        return_annotation,
+    )
 
-    if is_optional and response:
-        return_annotation = __get_optional_type(return_annotation)
-    elif is_optional and not response:
+    if is_optional and not response:
         return None
 
     if origin is list and not response:
@@ -95,16 +98,36 @@ async def process_response(
     if not response:
         raise EmptyResult
 
-    adapter = TypeAdapter(return_annotation)
+    adapter = _get_adapter(model_type)
 
     return adapter.validate_python(
         await __convert_response(
             response=response,
-            annotations=str(return_annotation),
+            annotations=annotations,
         ),
     )
 
 
+@lru_cache(maxsize=None)
+def __get_result_spec(return_annotation) -> tuple[Any, bool, Any, str]:
+    """Classify ``result_model`` once per annotation.
+
+    Args:
+        return_annotation: Type annotation passed as ``result_model``.
+
+    Returns: Tuple of ``(origin, is_optional, model_type, annotations)`` where
+        ``model_type`` is the annotation without ``Optional`` and
+        ``annotations`` is its string form.
+    """
+
+    origin = get_origin(return_annotation)
+    is_optional = __is_optional_type(origin)
+    model_type = (
+        __get_optional_type(return_annotation) if is_optional else return_annotation
+    )
+    return origin, is_optional, model_type, str(model_type)
+
+
 def __is_optional_type(origin) -> bool:
     """Check if the type is Optional or Union.
     Args:
@@ -173,7 +196,6 @@ def __get_optional_type(return_annotation) -> Type[Model]:
     if origin not in (Optional, Union):
         return return_annotation
     args = get_args(return_annotation)
-    for arg in args:
-        if arg is type(None):
-            continue
-        return arg
+    if len(args) == 2:
+        return args[0] if args[1] is NoneType else args[1]
+    return next(arg for arg in args if arg is not NoneType)
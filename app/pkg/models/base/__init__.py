@@ -7,4 +7,4 @@ All models **must** inherit from them.
 
 from app.pkg.models.base.enum import BaseEnum
 from app.pkg.models.base.exception import BaseAPIException
-from app.pkg.models.base.model import BaseModel, Model
+from app.pkg.models.base.model import BaseModel, ImmutableModel, Model
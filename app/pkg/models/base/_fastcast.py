@@ -0,0 +1,126 @@
+"""Value casting used by :meth:`.BaseModel.to_dict`.
+
+The module is kept free of pydantic model classes and fully annotated so it
+can be compiled with mypyc (``make fastcast``). The pure python version is
+used when the compiled extension is not built.
+"""
+
+from collections.abc import Callable
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any, TypeVar
+from uuid import UUID
+
+import pydantic
+
+__all__ = [
+    "CASTERS",
+    "PASSTHROUGH",
+    "Caster",
+    "cast",
+    "cast_dict",
+    "cast_identity",
+    "cast_list",
+    "resolve_caster",
+]
+
+_T = TypeVar("_T")
+
+Caster = Callable[[Any, bool], Any]
+
+# Types returned as is; checked before the caster lookup so the most common
+# values skip the caster call.
+PASSTHROUGH: frozenset[type] = frozenset(
+    {str, int, float, bool, bytes, type(None)},
+)
+
+
+def cast(v: Any, show_secrets: bool) -> Any:
+    """Cast value for dict object.
+
+    Args:
+        v:
+            Any value.
+        show_secrets:
+            If True, then the secret will be revealed.
+    """
+
+    tp: type = type(v)
+    if tp in PASSTHROUGH:
+        return v
+    caster = CASTERS.get(tp) or resolve_caster(tp)
+    return caster(v, show_secrets)
+
+
+def cast_dict(v: dict[Any, Any], show_secrets: bool) -> dict[Any, Any]:
+    return {k: cast(ve, show_secrets) for k, ve in v.items()}
+
+
+def cast_list(v: list[Any] | tuple[Any, ...], show_secrets: bool) -> list[Any]:
+    return [cast(ve, show_secrets) for ve in v]
+
+
+def cast_identity(v: _T, show_secrets: bool) -> _T:
+    return v
+
+
+def _cast_str(v: UUID | Decimal, show_secrets: bool) -> str:
+    return str(v)
+
+
+# ``isoformat`` skips the locale-aware ``strftime`` machinery. Slicing drops
+# the UTC offset so the output stays "%Y-%m-%d %H:%M:%S" / "%H:%M:%S".
+def _cast_datetime(v: datetime, show_secrets: bool) -> str:
+    return v.isoformat(sep=" ", timespec="seconds")[:19]
+
+
+def _cast_date(v: date, show_secrets: bool) -> str:
+    return v.isoformat()
+
+
+def _cast_time(v: time, show_secrets: bool) -> str:
+    return v.isoformat(timespec="seconds")[:8]
+
+
+def _cast_secret_str(v: pydantic.SecretStr, show_secrets: bool) -> str:
+    return v.get_secret_value() if show_secrets else str(v)
+
+
+def _cast_secret_bytes(v: pydantic.SecretBytes, show_secrets: bool) -> str:
+    return v.get_secret_value().decode() if show_secrets else str(v)
+
+
+# Exact type -> caster. Subclasses are resolved through the MRO once and
+# memoized by ``resolve_caster``.
+CASTERS: dict[type, Caster] = {
+    list: cast_list,
+    tuple: cast_list,
+    dict: cast_dict,
+    UUID: _cast_str,
+    Decimal: _cast_str,
+    datetime: _cast_datetime,
+    date: _cast_date,
+    time: _cast_time,
+    pydantic.SecretStr: _cast_secret_str,
+    pydantic.SecretBytes: _cast_secret_bytes,
+}
+
+
+def resolve_caster(tp: type) -> Caster:
+    """Find a caster for a type missing in :data:`CASTERS` and memoize it.
+
+    Args:
+        tp: Type of a value.
+
+    Returns:
+        Caster of the nearest registered base class or :func:`cast_identity`.
+    """
+
+    caster: Caster = cast_identity
+    for base in tp.__mro__[1:]:
+        found = CASTERS.get(base)
+        if found is not None:
+            caster = found
+            break
+    CASTERS[tp] = caster
+    return caster
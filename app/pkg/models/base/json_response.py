@@ -0,0 +1,57 @@
+"""JSON response rendered by pydantic-core."""
+
+from typing import Any
+
+import pydantic_core
+from starlette.responses import JSONResponse
+
+__all__ = ["ModelJSONResponse"]
+
+
+class ModelJSONResponse(JSONResponse):
+    """JSON response serialized in a single pass by ``pydantic_core.to_json``.
+
+    Handles pydantic models, ``datetime``, ``UUID`` and ``Decimal`` natively,
+    so a model can be passed as is, without :meth:`.BaseModel.to_dict` or
+    the ``json`` module.
+
+    Notes:
+        The response class is opt-in. Set as ``response_class`` of a route,
+        FastAPI still runs the route result through ``jsonable_encoder``
+        first; the encoding is skipped only when the route returns the
+        response object itself.
+
+    Examples:
+        Return the response from a route to serialize the model directly::
+
+            >>> @router.get("/users/{user_id}", response_model=models.User)
+            ... async def read_user(user_id: UUID) -> ModelJSONResponse:
+            ...     user = await repository.read(user_id)
+            ...     return ModelJSONResponse(user)
+    """
+
+    def render(self, content: Any) -> bytes:
+        """Serialize ``content`` to JSON bytes.
+
+        Args:
+            content: Any JSON-compatible object or pydantic model.
+
+        Raises:
+            ValueError: If ``content`` contains NaN or infinite floats, same
+                as :class:`starlette.responses.JSONResponse`.
+
+        Returns:
+            Encoded JSON.
+        """
+
+        body = pydantic_core.to_json(content, inf_nan_mode="constants")
+        if b"NaN" in body or b"Infinity" in body:
+            # The bytes may come from a string value; parsing without
+            # NaN/Infinity tokens tells them apart from float values.
+            try:
+                pydantic_core.from_json(body, allow_inf_nan=False)
+            except ValueError as error:
+                raise ValueError(
+                    "Out of range float values are not JSON compliant",
+                ) from error
+        return body
@@ -2,20 +2,149 @@
 
 from __future__ import annotations
 
+import types
 import typing
-from datetime import date, datetime, time
-from typing import Any, TypeVar
-from uuid import UUID
+from collections.abc import Callable
+from functools import partial
+from typing import Any, ClassVar, TypeVar, Union, get_args, get_origin
 
 import pydantic
-from _decimal import Decimal
-from polyfactory.factories.pydantic_factory import ModelFactory
-from pydantic import ConfigDict, TypeAdapter
+import pydantic_core
+from pydantic import ConfigDict, PlainSerializer, WrapSerializer
 
-__all__ = ["BaseModel", "Model"]
+from app.pkg.models.base._fastcast import (
+    CASTERS,
+    PASSTHROUGH,
+    cast,
+    cast_dict,
+    cast_identity,
+    cast_list,
+    resolve_caster,
+)
+
+__all__ = ["BaseModel", "ImmutableModel", "Model"]
 
 Model = TypeVar("Model", bound="BaseModel")
-_T = TypeVar("_T")
+
+
+def _cast_model(v: pydantic.BaseModel, show_secrets: bool) -> dict[Any, Any]:
+    if isinstance(v, BaseModel):
+        return v.to_dict(show_secrets=show_secrets)
+    return cast_dict(v.model_dump(), show_secrets)
+
+
+CASTERS[pydantic.BaseModel] = _cast_model
+
+
+def _reveal_secrets(v: Any) -> Any:
+    """Replace ``pydantic.Secret*`` objects in dumped values by their values.
+
+    Args:
+        v: Value returned by ``model_dump``.
+    """
+
+    if isinstance(v, dict):
+        return {k: _reveal_secrets(ve) for k, ve in v.items()}
+    if isinstance(v, (list, tuple)):
+        return [_reveal_secrets(ve) for ve in v]
+    if isinstance(v, pydantic.SecretBytes):
+        return v.get_secret_value().decode()
+    if isinstance(v, pydantic.SecretStr):
+        return v.get_secret_value()
+    return v
+
+
+_FieldCaster = Callable[[Any], Any]
+
+
+def _build_field_caster(
+    annotation: Any,
+    show_secrets: bool,
+) -> _FieldCaster | None:
+    """Choose a caster for a model field from its annotation.
+
+    Args:
+        annotation:
+            Annotation of the field.
+        show_secrets:
+            If True, then the secret will be revealed.
+
+    Returns:
+        Unary caster or None if the field is not a plain, registered scalar,
+        secret or model type (or ``Optional`` of one of them). The caster
+        trusts the annotation only when ``type(v)`` matches it exactly.
+    """
+
+    if get_origin(annotation) in (Union, types.UnionType):
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) != 1:
+            return None
+        annotation = args[0]
+
+    if not isinstance(annotation, type) or get_origin(annotation) is not None:
+        return None
+
+    caster = CASTERS.get(annotation) or resolve_caster(annotation)
+    if annotation not in PASSTHROUGH and caster in (
+        cast_identity,
+        cast_list,
+        cast_dict,
+    ):
+        return None
+
+    fallback = partial(cast, show_secrets=show_secrets)
+    if issubclass(annotation, pydantic.BaseModel):
+        fallback = partial(_cast_declared_model, annotation, show_secrets)
+
+    def _cast_field(v: Any) -> Any:
+        if type(v) is annotation:
+            return caster(v, show_secrets)
+        return fallback(v)
+
+    return _cast_field
+
+
+def _cast_declared_model(
+    annotation: type[pydantic.BaseModel],
+    show_secrets: bool,
+    v: Any,
+) -> Any:
+    """Cast a value of a model field which is not exactly of the field type.
+
+    Subclass instances are dumped by the declared model like in
+    ``model_dump``, so fields of the subclass are not exposed.
+    """
+
+    if isinstance(v, annotation):
+        return cast_dict(annotation.__pydantic_serializer__.to_python(v), show_secrets)
+    return cast(v, show_secrets)
+
+
+def _has_custom_serialization(cls: type[pydantic.BaseModel]) -> bool:
+    """Check if ``model_dump`` of ``cls`` does more than dumping field values.
+
+    Such models are not covered by the ``to_dict`` cast plans: excluded
+    fields, serializers, computed fields and serialization by alias are only
+    applied by ``model_dump``.
+    """
+
+    decorators = cls.__pydantic_decorators__
+    if (
+        decorators.field_serializers
+        or decorators.model_serializers
+        or cls.model_computed_fields
+        or cls.model_config.get("serialize_by_alias")
+    ):
+        return True
+
+    for field in cls.model_fields.values():
+        if field.exclude or getattr(field, "exclude_if", None) is not None:
+            return True
+        if any(
+            isinstance(m, (PlainSerializer, WrapSerializer)) for m in field.metadata
+        ):
+            return True
+    return False
 
 
 class BaseModel(pydantic.BaseModel):
@@ -29,10 +158,37 @@ class BaseModel(pydantic.BaseModel):
         coerce_numbers_to_str=True,
     )
 
+    # Per-field casters used by ``to_dict``, built once per subclass.
+    _dict_plan_hidden: ClassVar[list[tuple[str, _FieldCaster]] | None] = None
+    _dict_plan_shown: ClassVar[list[tuple[str, _FieldCaster]] | None] = None
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        """Build the ``to_dict`` cast plans from the model fields."""
+
+        super().__pydantic_init_subclass__(**kwargs)
+
+        cls._dict_plan_hidden = cls._dict_plan_shown = None
+        if _has_custom_serialization(cls):
+            return
+
+        plan_hidden: list[tuple[str, _FieldCaster]] = []
+        plan_shown: list[tuple[str, _FieldCaster]] = []
+        for name, field in cls.model_fields.items():
+            hidden = _build_field_caster(field.annotation, show_secrets=False)
+            shown = _build_field_caster(field.annotation, show_secrets=True)
+            if hidden is None or shown is None:
+                return
+            plan_hidden.append((name, hidden))
+            plan_shown.append((name, shown))
+
+        cls._dict_plan_hidden = plan_hidden
+        cls._dict_plan_shown = plan_shown
+
     def to_dict(
         self,
         show_secrets: bool = False,
-        values: dict[Any, Any] = None,
+        values: dict[Any, Any] | None = None,
         **kwargs,
     ) -> dict[Any, Any]:
         """Make a representation model from a class object to Dict object.
@@ -44,6 +200,9 @@ class BaseModel(pydantic.BaseModel):
                 Shows secret in dict an object if True.
             values:
                 Using an object to write to a Dict object.
+                If passed, the model is not dumped and only ``values``
+                are cast; nested dicts are cast on their own, without
+                the model context.
             **kwargs:
                 Optional arguments to be passed to the Dict object.
 
@@ -112,93 +271,69 @@ class BaseModel(pydantic.BaseModel):
             Dict object with reveal password filed.
         """
 
-        values = self.model_dump(**kwargs).items() if not values else values.items()
-        r = {}
-        for k, v in values:
-            v = self.__cast_values(v=v, show_secrets=show_secrets)
-            r[k] = v
-        return r
-
-    def __cast_values(self, v: _T, show_secrets: bool, **kwargs) -> _T:
-        """Cast value for dict object.
-
-        Args:
-            v:
-                Any value.
-            show_secrets:
-                If True, then the secret will be revealed.
-
-        Warnings:
-            This method is not memory optimized.
-        """
-
-        if isinstance(v, (typing.List, typing.Tuple, list, tuple)):
-            return [
-                self.__cast_values(v=ve, show_secrets=show_secrets, **kwargs)
-                for ve in v
-            ]
+        if values:
+            return cast_dict(values, show_secrets)
 
-        elif isinstance(v, (pydantic.SecretBytes, pydantic.SecretStr)):
-            return self.__cast_secret(v=v, show_secrets=show_secrets)
+        plan = self._dict_plan_shown if show_secrets else self._dict_plan_hidden
+        if plan is None or kwargs or self.__pydantic_extra__:
+            return cast_dict(self.model_dump(**kwargs), show_secrets)
+        # Attributes dropped by ``delete_attribute`` are skipped, like in
+        # ``model_dump``.
+        attributes = self.__dict__
+        return {k: fn(attributes[k]) for k, fn in plan if k in attributes}
 
-        elif isinstance(v, (dict, typing.Dict)) and v:
-            return self.to_dict(show_secrets=show_secrets, values=v, **kwargs)
+    def to_json(self, show_secrets: bool = False) -> bytes:
+        """Serialize model to JSON in a single pydantic-core pass.
 
-        elif isinstance(v, (UUID, Decimal)):
-            return str(v)
-
-        elif isinstance(v, (datetime, date, time)):
-            return self.__cast_datetime_types(v=v)
-
-        return v
-
-    @staticmethod
-    def __cast_datetime_types(v: _T) -> _T:
-        """Cast datetime types to str.
+        Unlike :meth:`.to_dict`, values are encoded by their JSON schema, e.g.
+        ``datetime`` as ISO 8601 string.
 
         Args:
-            v: Any value.
-
-        Returns:
-            str value of ``v``.
-        """
-
-        if isinstance(v, datetime):
-            return v.strftime("%Y-%m-%d %H:%M:%S")
-        elif isinstance(v, date):
-            return v.strftime("%Y-%m-%d")
-        elif isinstance(v, time):
-            return v.strftime("%H:%M:%S")
+            show_secrets:
+                bool.
+                default False.
+                Shows secret in JSON object if True.
 
-    @staticmethod
-    def __cast_secret(v, show_secrets: bool) -> str:
-        """Cast secret value to str.
+        Examples:
+            Secrets are hidden by default::
 
-        Args:
-            v: pydantic.Secret* object.
-            show_secrets: bool value. If True, then the secret will be revealed.
+                >>> class TestModel(BaseModel):
+                ...     some_value: pydantic.SecretStr
+                >>> model = TestModel(some_value="key")
+                >>> model.to_json()
+                b'{"some_value":"**********"}'
+                >>> model.to_json(show_secrets=True)
+                b'{"some_value":"key"}'
 
-        Returns: str value of ``v``.
+        Returns:
+            Encoded JSON object.
         """
 
-        if isinstance(v, pydantic.SecretBytes):
-            return v.get_secret_value().decode() if show_secrets else str(v)
-        elif isinstance(v, pydantic.SecretStr):
-            return v.get_secret_value() if show_secrets else str(v)
+        if not show_secrets:
+            return pydantic_core.to_json(self)
+        return pydantic_core.to_json(_reveal_secrets(self.model_dump()))
 
     def delete_attribute(self, attr: str) -> BaseModel:
         """Delete some attribute field from a model.
 
+        The model itself is not changed: the attribute is removed from a
+        shallow copy without re-validation, so it also works for frozen
+        models. The copy is meant for serialization: :meth:`.to_dict`,
+        :meth:`.to_json` and :meth:`.migrate` skip the deleted field, while
+        reading it as an attribute raises ``AttributeError``.
+
         Args:
             attr:
                 name of field.
 
         Returns:
-            self object.
+            New model object without ``attr``.
         """
 
-        delattr(self, attr)
-        return self
+        model = self.model_copy()
+        model.__dict__.pop(attr, None)
+        model.__pydantic_fields_set__.discard(attr)
+        return model
 
     def migrate(
         self,
@@ -293,6 +428,8 @@ class BaseModel(pydantic.BaseModel):
             pydantic model parsed from ``model``.
         """
 
+        # Casting to primitives lets UUID/datetime/secret values migrate into
+        # ``str`` fields of the target model.
         self_dict_model = self.to_dict(show_secrets=True)
 
         if not match_keys:
@@ -306,9 +443,11 @@ class BaseModel(pydantic.BaseModel):
         for key, value in extra_fields.items():
             self_dict_model[key] = value
 
-        adapter = TypeAdapter(model)
         if not random_fill:
-            return adapter.validate_python(self_dict_model)
+            return model.model_validate(self_dict_model)
+
+        # polyfactory pulls faker in, so it is imported only when needed.
+        from polyfactory.factories.pydantic_factory import ModelFactory
 
         class Factory(ModelFactory[model]): ...
 
@@ -327,7 +466,30 @@ class BaseModel(pydantic.BaseModel):
                 >>> city = models.City.factory().build(city_code="MSK")
         """
 
+        from polyfactory.factories.pydantic_factory import ModelFactory
+
         class Factory(ModelFactory[cls]):
             __use_defaults__ = False
 
         return Factory
+
+
+class ImmutableModel(BaseModel):
+    """Base model for data read from repositories.
+
+    Unlike :class:`.BaseModel`, assignments are not re-validated and instances
+    are frozen, so models returned by ``collect_response`` are built once and
+    never mutated. Models used as API input should inherit
+    :class:`.BaseModel`.
+
+    Examples:
+        Use :meth:`.BaseModel.migrate` or ``model_copy`` to get a changed
+        instance::
+
+            >>> class User(ImmutableModel):
+            ...     name: str
+            >>> user = User(name="a")
+            >>> user.model_copy(update={"name": "b"})  # User(name='b')
+    """
+
+    model_config = ConfigDict(validate_assignment=False, frozen=True)
@@ -5,7 +5,7 @@ from uuid import UUID
 
 from pydantic.fields import Field
 
-from app.pkg.models.base import BaseModel
+from app.pkg.models.base import BaseModel, ImmutableModel
 from app.pkg.models.base.optional_field import create_optional_fields_class
 
 __all__ = [
@@ -49,8 +49,8 @@ class UserFields:
 OptionalFolderFields = create_optional_fields_class(UserFields)
 
 
-class User(BaseUser):
-    """User model."""
+class User(BaseUser, ImmutableModel):
+    """User model read from the repository."""
 
     id: UUID = UserFields.id
     email: str = UserFields.email
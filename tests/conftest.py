@@ -0,0 +1,8 @@
+"""Common test configuration."""
+
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+# ``app`` builds settings on import; use the example env unless it is set.
+load_dotenv(Path(__file__).parent.parent / ".env.example", override=False)
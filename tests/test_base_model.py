@@ -0,0 +1,334 @@
+"""Tests for :class:`app.pkg.models.base.BaseModel`."""
+
+import json
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+from typing import Annotated, Optional
+from uuid import UUID
+
+import pydantic
+import pytest
+
+from app.pkg.models import v1 as models
+from app.pkg.models.base import BaseModel, ImmutableModel, _fastcast
+from app.pkg.models.v1.app.user import BaseUser
+
+
+class SubSecretStr(pydantic.SecretStr):
+    pass
+
+
+def test_models_import_and_to_dict():
+    user = models.User(
+        id=UUID("123e4567-e89b-12d3-a456-426614174000"),
+        email="user@mail.ru",
+        hashed_password="hash",
+        is_active=True,
+        created_at=datetime(2025, 7, 21, 16, 30),
+        updated_at=datetime(2025, 7, 21, 16, 30, 5),
+    )
+
+    assert user.to_dict() == {
+        "id": "123e4567-e89b-12d3-a456-426614174000",
+        "email": "user@mail.ru",
+        "hashed_password": "hash",
+        "is_active": True,
+        "created_at": "2025-07-21 16:30:00",
+        "updated_at": "2025-07-21 16:30:05",
+    }
+
+
+def test_to_dict_secrets_and_nested_models():
+    class Inner(BaseModel):
+        secret: pydantic.SecretStr
+        sub_secret: SubSecretStr
+
+    class Outer(BaseModel):
+        inner: Inner
+        items: list[Inner]
+        mapping: dict[str, Decimal]
+        day: date
+
+    inner = Inner(secret="key", sub_secret=SubSecretStr("sub"))
+    model = Outer(inner=inner, items=[inner], mapping={"a": "1.5"}, day="2025-07-21")
+
+    assert model.to_dict() == {
+        "inner": {"secret": "**********", "sub_secret": "**********"},
+        "items": [{"secret": "**********", "sub_secret": "**********"}],
+        "mapping": {"a": "1.5"},
+        "day": "2025-07-21",
+    }
+    assert model.to_dict(show_secrets=True)["items"] == [
+        {"secret": "key", "sub_secret": "sub"},
+    ]
+
+
+def test_to_dict_values():
+    class Model(BaseModel):
+        a: int
+
+    values = {"uuid": UUID(int=1), "nested": {"at": datetime(2025, 7, 21)}}
+
+    assert Model(a=1).to_dict(values=values) == {
+        "uuid": "00000000-0000-0000-0000-000000000001",
+        "nested": {"at": "2025-07-21 00:00:00"},
+    }
+
+
+class Inner(BaseModel):
+    a: int
+
+
+class SubInner(Inner):
+    hidden: str
+
+
+@dataclass
+class DataClass:
+    x: int
+
+
+def test_to_dict_uses_cast_plan_for_plain_models():
+    assert models.User._dict_plan_hidden is not None
+    assert models.User._dict_plan_shown is not None
+
+
+def test_to_dict_skips_excluded_fields():
+    class Model(BaseModel):
+        a: int
+        hidden: str = pydantic.Field(exclude=True)
+
+    assert Model(a=1, hidden="x").to_dict() == {"a": 1}
+
+
+def test_to_dict_applies_serializers():
+    class FieldSerializerModel(BaseModel):
+        n: int
+
+        @pydantic.field_serializer("n")
+        def serialize_n(self, n: int) -> int:
+            return n * 10
+
+    class PlainSerializerModel(BaseModel):
+        n: Annotated[int, pydantic.PlainSerializer(lambda v: v * 10)]
+        items: list[Annotated[int, pydantic.PlainSerializer(lambda v: v * 10)]]
+
+    assert FieldSerializerModel(n=1).to_dict() == {"n": 10}
+    assert PlainSerializerModel(n=1, items=[2]).to_dict() == {"n": 10, "items": [20]}
+
+
+def test_to_dict_dumps_dataclass_fields():
+    class Model(BaseModel):
+        dc: DataClass
+
+    assert Model(dc=DataClass(x=1)).to_dict() == {"dc": {"x": 1}}
+
+
+def test_to_dict_dumps_model_fields_by_declared_type():
+    class Model(BaseModel):
+        inner: Inner
+        optional: Optional[Inner] = None
+
+    model = Model(inner=SubInner(a=1, hidden="x"), optional=SubInner(a=2, hidden="y"))
+
+    assert model.to_dict() == {"inner": {"a": 1}, "optional": {"a": 2}}
+
+
+def test_to_dict_on_constructed_model_with_raw_values():
+    class Model(BaseModel):
+        at: datetime
+        id: UUID
+        name: str
+
+    model = Model.model_construct(at="2025-01-01T00:00:00", id=UUID(int=1), name=1)
+
+    assert model.to_dict() == {
+        "at": "2025-01-01T00:00:00",
+        "id": "00000000-0000-0000-0000-000000000001",
+        "name": 1,
+    }
+
+
+def test_to_dict_after_delete_attribute():
+    class Model(BaseModel):
+        a: int
+        b: int
+
+    assert Model(a=1, b=2).delete_attribute("a").to_dict() == {"b": 2}
+
+
+def test_to_dict_datetime_formats():
+    class Model(BaseModel):
+        at: datetime
+        day: date
+        clock: time
+
+    model = Model(
+        at=datetime(2025, 7, 21, 16, 30, 5, 123456, tzinfo=timezone.utc),
+        day=date(2025, 7, 21),
+        clock=time(1, 2, 3, 456, tzinfo=timezone(timedelta(hours=3))),
+    )
+
+    assert model.to_dict() == {
+        "at": "2025-07-21 16:30:05",
+        "day": "2025-07-21",
+        "clock": "01:02:03",
+    }
+    assert model.to_dict(values={"at": [datetime(2025, 1, 1)]}) == {
+        "at": ["2025-01-01 00:00:00"],
+    }
+
+
+def test_migrate_casts_values_for_str_fields():
+    class InnerA(BaseModel):
+        secret: pydantic.SecretStr
+
+    class A(BaseModel):
+        id: UUID
+        ts: datetime
+        inner: InnerA
+
+    class InnerB(BaseModel):
+        secret: str
+
+    class B(BaseModel):
+        id: str
+        ts: str
+        inner: InnerB
+
+    a = A(id=UUID(int=1), ts=datetime(2025, 7, 21, 16, 30), inner=InnerA(secret="x"))
+
+    assert a.migrate(B) == B(
+        id="00000000-0000-0000-0000-000000000001",
+        ts="2025-07-21 16:30:00",
+        inner=InnerB(secret="x"),
+    )
+
+
+def test_migrate_match_keys_and_extra_fields():
+    class A(BaseModel):
+        a: int
+        b: int
+
+    class B(BaseModel):
+        aa: int
+        b: int
+        c: int
+
+    assert A(a=1, b=2).migrate(B, match_keys={"aa": "a"}, extra_fields={"c": 3}) == B(
+        aa=1,
+        b=2,
+        c=3,
+    )
+
+
+def test_fastcast_memoizes_subclass_casters():
+    class Secret(pydantic.SecretStr):
+        pass
+
+    assert Secret not in _fastcast.CASTERS
+
+    assert _fastcast.cast(Secret("x"), show_secrets=True) == "x"
+    assert _fastcast.CASTERS[Secret] is _fastcast.CASTERS[pydantic.SecretStr]
+
+
+def test_fastcast_passes_plain_values_through():
+    for value in ("s", 1, 1.5, True, b"b", None):
+        assert _fastcast.cast(value, show_secrets=False) is value
+
+    class Model(BaseModel):
+        count: int
+        name: Optional[str] = None
+
+    assert Model.model_construct(count=UUID(int=1)).to_dict() == {
+        "count": "00000000-0000-0000-0000-000000000001",
+        "name": None,
+    }
+
+
+def test_only_user_read_model_is_frozen():
+    class UserCommand(BaseUser):
+        email: str
+
+    command = UserCommand(email="a@mail.ru")
+    command.email = "b@mail.ru"
+
+    assert command.email == "b@mail.ru"
+    assert issubclass(models.User, ImmutableModel)
+    assert models.User.model_config["frozen"] is True
+
+
+def test_immutable_model_rejects_assignment():
+    class Model(ImmutableModel):
+        a: int
+
+    model = Model(a=1)
+
+    with pytest.raises(pydantic.ValidationError):
+        model.a = 2
+    assert model.model_copy(update={"a": 2}).a == 2
+
+
+def test_delete_attribute_returns_copy():
+    class Model(ImmutableModel):
+        a: int
+        b: int
+        hidden: int = pydantic.Field(0, exclude=True)
+
+    class Target(BaseModel):
+        b: int
+
+    model = Model(a=1, b=2)
+    deleted = model.delete_attribute("a")
+
+    assert model.a == 1
+    assert "a" not in deleted.model_fields_set
+    assert deleted.to_dict() == {"b": 2}
+    assert json.loads(deleted.to_json()) == {"b": 2}
+    assert deleted.migrate(Target) == Target(b=2)
+    with pytest.raises(AttributeError):
+        deleted.a
+
+
+def test_to_json_secrets():
+    class InnerSecret(BaseModel):
+        secret: pydantic.SecretBytes
+
+    class Model(BaseModel):
+        some_value: pydantic.SecretStr
+        inner: list[InnerSecret]
+        at: datetime
+
+    model = Model(
+        some_value="key",
+        inner=[InnerSecret(secret=b"value")],
+        at=datetime(2025, 7, 21, 16, 30),
+    )
+
+    assert json.loads(model.to_json()) == {
+        "some_value": "**********",
+        "inner": [{"secret": "**********"}],
+        "at": "2025-07-21T16:30:00",
+    }
+    assert json.loads(model.to_json(show_secrets=True)) == {
+        "some_value": "key",
+        "inner": [{"secret": "value"}],
+        "at": "2025-07-21T16:30:00",
+    }
+
+
+def test_factory_and_random_fill():
+    class Source(BaseModel):
+        a: int
+
+    class Target(BaseModel):
+        a: int
+        b: str
+
+    assert isinstance(Target.factory().build(), Target)
+
+    target = Source(a=1).migrate(Target, random_fill=True)
+
+    assert target.a == 1
+    assert isinstance(target.b, str)
@@ -0,0 +1,224 @@
+"""Tests for postgresql :func:`collect_response`."""
+
+import asyncio
+from types import SimpleNamespace
+from collections.abc import AsyncIterator
+from typing import List, Optional
+
+import pytest
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.internal.repository.v1.postgresql.handlers import (
+    collect_response as collect_response_module,
+)
+from app.internal.repository.v1.postgresql.handlers.collect_response import (
+    collect_response,
+    collect_response_iter,
+)
+from app.pkg.models.base import BaseModel
+from app.pkg.models.v1.exceptions.repository import DriverError, EmptyResult
+
+
+class Item(BaseModel):
+    a: int
+
+
+class DetachedRow:
+    @property
+    def a(self) -> int:
+        raise SQLAlchemyError("detached")
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+def collect(iterator):
+    async def consume():
+        return [item async for item in iterator]
+
+    return run(consume())
+
+
+def test_single():
+    @collect_response
+    async def read_one() -> Item:
+        return {"a": 1}
+
+    assert run(read_one()) == Item(a=1)
+    assert run(read_one()) == Item(a=1)
+
+
+def test_empty_responses():
+    @collect_response
+    async def read_one() -> Item:
+        return None
+
+    @collect_response
+    async def read_optional() -> Optional[Item]:
+        return None
+
+    @collect_response
+    async def read_none() -> None:
+        return {"a": 1}
+
+    with pytest.raises(EmptyResult):
+        run(read_one())
+    assert run(read_optional()) is None
+    assert run(read_none()) is None
+
+
+def test_list():
+    @collect_response
+    async def read_all() -> list[Item]:
+        return [{"a": 1}, {"a": 2}]
+
+    @collect_response
+    async def read_empty() -> list[Item]:
+        return []
+
+    assert run(read_all()) == [Item(a=1), Item(a=2)]
+    assert run(read_empty()) == []
+
+
+def test_typing_list_and_optional_list():
+    @collect_response
+    async def read_all() -> List[Item]:
+        return ({"a": 1},)
+
+    @collect_response
+    async def read_optional() -> Optional[List[Item]]:
+        return [{"a": 2}]
+
+    assert run(read_all()) == [Item(a=1)]
+    assert run(read_optional()) == [Item(a=2)]
+
+
+def test_union_none_annotations():
+    @collect_response
+    async def read_optional(response) -> Item | None:
+        return response
+
+    @collect_response
+    async def read_optional_list(response) -> None | list[Item]:
+        return response
+
+    @collect_response_iter
+    async def iter_optional(response) -> list[Item] | None:
+        return response
+
+    assert run(read_optional({"a": 1})) == Item(a=1)
+    assert run(read_optional(None)) is None
+    assert run(read_optional_list([{"a": 1}])) == [Item(a=1)]
+    assert run(read_optional_list([])) is None
+    assert collect(iter_optional([{"a": 1}])) == [Item(a=1)]
+    assert collect(iter_optional(None)) == []
+
+
+def test_trusted_constructs_from_mappings_and_attributes():
+    class Defaulted(BaseModel):
+        a: int
+        b: int = 7
+
+    @collect_response(trusted=True)
+    async def read_all() -> list[Defaulted]:
+        return [SimpleNamespace(a=1), {"a": 2, "b": 3}]
+
+    @collect_response(trusted=True)
+    async def read_one() -> Optional[Defaulted]:
+        return SimpleNamespace(a=4, b=5)
+
+    assert run(read_all()) == [Defaulted(a=1), Defaulted(a=2, b=3)]
+    assert run(read_one()) == Defaulted(a=4, b=5)
+
+
+def test_trusted_does_not_build_adapter(monkeypatch):
+    def fail(tp):
+        raise AssertionError(f"TypeAdapter built for {tp}")
+
+    monkeypatch.setattr(collect_response_module, "_get_adapter", fail)
+
+    @collect_response(trusted=True)
+    async def read_one() -> Item:
+        return {"a": 1}
+
+    assert run(read_one()) == Item(a=1)
+
+
+def test_driver_errors():
+    @collect_response
+    async def read_one() -> Item:
+        raise SQLAlchemyError("connection lost")
+
+    @collect_response(trusted=True)
+    async def read_all() -> list[Item]:
+        return [DetachedRow()]
+
+    with pytest.raises(DriverError):
+        run(read_one())
+    with pytest.raises(DriverError):
+        run(read_all())
+
+
+def test_iter_list():
+    @collect_response_iter
+    async def read_all() -> list[Item]:
+        return [{"a": 1}, {"a": 2}]
+
+    assert collect(read_all()) == [Item(a=1), Item(a=2)]
+
+
+def test_iter_async_iterable():
+    async def rows():
+        yield {"a": 1}
+        yield {"a": 2}
+
+    @collect_response_iter
+    async def read_all() -> AsyncIterator[Item]:
+        return rows()
+
+    assert collect(read_all()) == [Item(a=1), Item(a=2)]
+
+
+def test_iter_empty_responses():
+    @collect_response_iter
+    async def read_empty() -> list[Item]:
+        return []
+
+    @collect_response_iter
+    async def read_none() -> Optional[list[Item]]:
+        return None
+
+    assert collect(read_empty()) == []
+    assert collect(read_none()) == []
+
+
+def test_iter_trusted(monkeypatch):
+    monkeypatch.setattr(collect_response_module, "_get_adapter", None)
+
+    @collect_response_iter(trusted=True)
+    async def read_all() -> list[Item]:
+        return [SimpleNamespace(a=1), {"a": 2}]
+
+    assert collect(read_all()) == [Item(a=1), Item(a=2)]
+
+
+def test_iter_translates_sqlalchemy_errors():
+    async def rows():
+        yield {"a": 1}
+        raise SQLAlchemyError("connection lost")
+
+    @collect_response_iter
+    async def read_all() -> AsyncIterator[Item]:
+        return rows()
+
+    with pytest.raises(DriverError):
+        collect(read_all())
+
+
+def test_iter_rejects_non_generic_annotation():
+    with pytest.raises(TypeError):
+
+        @collect_response_iter
+        async def read_one() -> Item:
+            return {"a": 1}
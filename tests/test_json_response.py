@@ -0,0 +1,40 @@
+"""Tests for :class:`app.pkg.models.base.json_response.ModelJSONResponse`."""
+
+import json
+from datetime import datetime
+from uuid import UUID
+
+import pytest
+
+from app.pkg.models.base import BaseModel
+from app.pkg.models.base.json_response import ModelJSONResponse
+
+
+class Item(BaseModel):
+    id: UUID
+    at: datetime
+
+
+def test_render_native_types():
+    response = ModelJSONResponse(
+        {
+            "item": Item(id=UUID(int=1), at=datetime(2025, 7, 21, 16, 30)),
+            "text": "NaN",
+            "values": ["-Infinity", 1.5],
+        },
+    )
+
+    assert json.loads(response.body) == {
+        "item": {
+            "id": "00000000-0000-0000-0000-000000000001",
+            "at": "2025-07-21T16:30:00",
+        },
+        "text": "NaN",
+        "values": ["-Infinity", 1.5],
+    }
+
+
+@pytest.mark.parametrize("value", [float("nan"), float("inf"), float("-inf")])
+def test_render_rejects_out_of_range_floats(value):
+    with pytest.raises(ValueError):
+        ModelJSONResponse({"text": "NaN", "value": [value]})
@@ -0,0 +1,70 @@
+"""Tests for redis :func:`collect_response`."""
+
+import asyncio
+import json
+from typing import List, Optional, Union
+
+import pytest
+
+from app.internal.repository.v1.redis.handlers import (
+    collect_response as collect_response_module,
+)
+from app.pkg.models.base import BaseModel
+from app.pkg.models.v1.exceptions.repository import EmptyResult
+
+
+class Item(BaseModel):
+    a: int
+
+
+async def fn():
+    """Placeholder for the decorated query."""
+
+
+def process(response, result_model):
+    return asyncio.run(
+        collect_response_module.process_response(
+            fn,
+            response,
+            result_model=result_model,
+        ),
+    )
+
+
+def test_single():
+    assert process(json.dumps({"a": 1}).encode(), Item) == Item(a=1)
+
+
+def test_list():
+    response = json.dumps([{"a": 1}, {"a": 2}]).encode()
+
+    assert process(response, List[Item]) == [Item(a=1), Item(a=2)]
+
+
+def test_adapter_is_cached():
+    collect_response_module._get_adapter.cache_clear()
+
+    process(json.dumps({"a": 1}).encode(), Item)
+    process(json.dumps({"a": 2}).encode(), Item)
+
+    assert collect_response_module._get_adapter.cache_info().currsize == 1
+
+
+def test_optional():
+    assert process(json.dumps({"a": 1}).encode(), Optional[Item]) == Item(a=1)
+    assert process(None, Optional[Item]) is None
+    assert process(b"", Optional[List[Item]]) is None
+
+
+def test_union_none_unwrap():
+    response = json.dumps({"a": 1}).encode()
+
+    assert process(response, Union[None, Item]) == Item(a=1)
+    assert process(response, Union[Item, int, None]) == Item(a=1)
+
+
+def test_empty_responses():
+    assert process(None, List[Item]) == []
+    assert process(json.dumps({"a": 1}).encode(), None) is None
+    with pytest.raises(EmptyResult):
+        process(None, Item)